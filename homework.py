@@ -1,30 +1,85 @@
+import json
 import logging
+import logging.config
+import random
+import signal
 import time
+import orjson
 import requests
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import telegram
+from telegram.utils.request import Request
 import sys
-from more_exceptions import UndocumentedStatus
+from more_exceptions import (APIStatusError, RateLimitError,
+                             UndocumentedStatus)
 from http import HTTPStatus
 
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='{asctime}, {levelname}, {message}, {name}',
-    style='{',
-)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+# Логирование настраивается один раз при запуске бота, а не при импорте
+# модуля: все логгеры пишут через единственный обработчик корневого.
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {
+            'format': '{asctime}, {levelname}, {message}, {name}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'default',
+        },
+    },
+    'root': {
+        'level': LOG_LEVEL,
+        'handlers': ['console'],
+    },
+}
+
+logger = logging.getLogger(__name__)
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
-RETRY_PERIOD = 600
-PERIOD_TIME_DAYS = 30
+RETRY_PERIOD = int(os.getenv('RETRY_PERIOD', 600))
+# Предельный интервал опроса, до которого он растёт, пока статусы
+# не меняются. Не может быть меньше RETRY_PERIOD, иначе простой ускорял бы
+# опрос.
+MAX_INTERVAL = max(RETRY_PERIOD, int(os.getenv('MAX_INTERVAL', 3600)))
+# Пауза между сообщениями одного опроса: не более 25 сообщений в секунду.
+SEND_INTERVAL = 1 / 25
+# Параметры экспоненциальной паузы после ошибок, в секундах.
+BACKOFF_BASE = 5
+BACKOFF_CAP = 300
+BACKOFF_JITTER = 5
+# Глубина первого опроса: работы за последние 30 дней, в секундах.
+PERIOD_SECONDS = 30 * 24 * 60 * 60
+STATE_FILE = os.getenv('STATE_FILE', '.hw_state.json')
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+# Таймауты запроса к API (на соединение, на чтение ответа), в секундах.
+API_TIMEOUT = (5, 30)
+
+# Одна сессия на всё время работы бота: соединение с API переиспользуется
+# между опросами, и TLS-рукопожатие не повторяется на каждой итерации.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[500, 502, 503, 504]),
+))
 
 
 HOMEWORK_VERDICTS = {
@@ -33,15 +88,35 @@ HOMEWORK_VERDICTS = {
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
 
+# Готовые шаблоны сообщений для каждого статуса: в parse_status остаётся
+# подставить только название работы.
+_MSG_TEMPLATES = {
+    status: 'Изменился статус проверки работы "{name}".' + verdict
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
 
 def check_tokens():
     """
     Проверяет наличие необходимых переменных окружения.
 
-    :raises Exception: Если одна из переменных окружения отсутствует.
+    Значения берутся из констант модуля, окружение повторно не читается.
+    :return: True, если заданы все переменные окружения.
+    :rtype: bool
     """
-    tokens = (PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID)
-    return all(tokens)
+    tokens = {
+        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
+        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
+        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID,
+    }
+    missing = [name for name, value in tokens.items() if not value]
+    if missing:
+        logger.critical(
+            f'Не заданы переменные окружения: {", ".join(missing)}'
+        )
+        return False
+    logger.debug('Все переменные окружения доступны')
+    return True
 
 
 def send_message(bot, message):
@@ -52,13 +127,21 @@ def send_message(bot, message):
     :type bot: telegram.Bot
     :param message: Текст сообщения.
     :type message: str
-    :return: None
+    :return: True, если сообщение отправлено.
+    :rtype: bool
+    :raises RateLimitError: Если Telegram просит подождать перед повторной
+    отправкой.
     """
     try:
         bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
-        logging.debug('Сообщение отправлено')
+        logger.debug('Сообщение отправлено')
+        return True
+    except telegram.error.RetryAfter as e:
+        logger.warning('Превышен лимит отправки сообщений в Telegram')
+        raise RateLimitError(e.retry_after) from None
     except telegram.error.TelegramError:
-        logging.error('Произошла ошибка отправки сообщения ботом')
+        logger.error('Произошла ошибка отправки сообщения ботом')
+        return False
 
 
 def get_api_answer(timestamp):
@@ -69,20 +152,33 @@ def get_api_answer(timestamp):
     :type timestamp: int
     :return: Словарь с ответом от API.
     :rtype: dict
-    :raises Exception: В случае ошибки при запросе API (код ответа не равен
-    200).
+    :raises RateLimitError: Если API вернул код 429.
+    :raises APIStatusError: Если код ответа API не равен 200.
+    :raises ConnectionError: Если запрос к API не удался.
+    :raises TimeoutError: Если API не ответил вовремя.
     """
+    params = {'from_date': timestamp}
     try:
-        params = {'from_date': timestamp}
-        response_api = requests.get(url=ENDPOINT, params=params,
-                                    headers=HEADERS)
+        response_api = SESSION.get(ENDPOINT, params=params,
+                                   timeout=API_TIMEOUT, stream=False)
+    except requests.Timeout as e:
+        logger.error(f'API не ответил за отведённое время: {e}')
+        raise TimeoutError(
+            f'Превышено время ожидания ответа API: {e}'
+        ) from None
     except requests.RequestException as e:
-        logging.error(f'Ошибка при запросе API: {e}')
+        logger.error(f'Ошибка при запросе API: {e}')
+        raise ConnectionError(f'Ошибка при запросе API: {e}') from None
 
+    if response_api.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = response_api.headers.get('Retry-After', '1')
+        raise RateLimitError(int(retry_after) if retry_after.isdigit() else 1)
     if response_api.status_code != HTTPStatus.OK:
-        raise Exception(f'Ошибка при запросе API: код ответа'
-                        f'{response_api.status_code}')
-    response = response_api.json()
+        raise APIStatusError(response_api.status_code)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Получен ответ API размером %d байт',
+                     len(response_api.content))
+    response = orjson.loads(response_api.content)
     return response
 
 
@@ -105,7 +201,7 @@ def check_response(response):
         raise KeyError('В словаре отсутствует ключ "homeworks"')
     if not isinstance(homeworks, list):
         raise TypeError('Значение ключа "homeworks" должно  быть списком')
-    return response
+    return homeworks
 
 
 def parse_status(homework):
@@ -113,50 +209,279 @@ def parse_status(homework):
     try:
         if (status := homework.get('status')) is None:
             raise KeyError('В словаре отсутствует ключ "status"')
-        if status not in HOMEWORK_VERDICTS:
+        if (template := _MSG_TEMPLATES.get(status)) is None:
             raise UndocumentedStatus('Неизвестный статус работы')
         if (homework_name := homework.get('homework_name')) is None:
             raise KeyError('В словаре отсутствует ключ "homework_name"')
-        verdict = HOMEWORK_VERDICTS[status]
-        return (f'Изменился статус проверки работы "{homework_name}".'
-                f'{verdict}')
+        return template.format(name=homework_name)
     except (KeyError, UndocumentedStatus) as e:
-        logging.error((f'Ошибка при попытке извлечения статуса работы из'
-                       f'ответа API: {e}'))
+        logger.error(f'Ошибка при попытке извлечения статуса работы из '
+                     f'ответа API: {e}')
         raise e from None
 
 
+def load_state():
+    """
+    Загружает состояние бота из файла STATE_FILE.
+
+    Состояние хранит последние отправленные статусы работ
+    (``{'statuses': {id работы: статус}}``) и метку времени последнего
+    опроса (``'timestamp'``), чтобы после перезапуска бот не присылал уже
+    известные вердикты повторно и запрашивал только новые изменения.
+    :return: Словарь с состоянием или пустой словарь, если файла нет.
+    :rtype: dict
+    """
+    try:
+        with open(STATE_FILE, encoding='utf-8') as file:
+            state = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f'Не удалось прочитать файл состояния: {e}')
+        return {}
+    if not isinstance(state, dict):
+        logger.warning('Файл состояния не содержит словарь, он будет '
+                       'перезаписан')
+        return {}
+    return state
+
+
+def save_state(state):
+    """
+    Атомарно сохраняет состояние бота в файл STATE_FILE.
+
+    Данные сначала пишутся во временный файл, который затем подменяет
+    основной, поэтому прерванная запись не портит состояние.
+    :param state: Словарь с состоянием бота.
+    :type state: dict
+    :return: None
+    """
+    tmp_file = f'{STATE_FILE}.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False)
+        os.replace(tmp_file, STATE_FILE)
+    except OSError as e:
+        logger.error(f'Не удалось сохранить файл состояния: {e}')
+
+
+def notify_status(bot, homework, state, pause=False):
+    """
+    Отправляет сообщение о статусе работы, если он изменился.
+
+    Последний отправленный статус каждой работы хранится в состоянии бота,
+    повторно известный статус не отправляется.
+    :param bot: Экземпляр объекта Bot из библиотеки python-telegram-bot.
+    :type bot: telegram.Bot
+    :param homework: Словарь с данными домашней работы из ответа API.
+    :type homework: dict
+    :param state: Словарь с состоянием бота.
+    :type state: dict
+    :param pause: Выдержать паузу SEND_INTERVAL перед отправкой, если в этом
+    опросе уже отправлялись сообщения.
+    :type pause: bool
+    :return: None, если статус не изменился, иначе True или False
+    в зависимости от того, доставлено ли сообщение.
+    :rtype: bool | None
+    """
+    message = parse_status(homework)
+    statuses = state.setdefault('statuses', {})
+    hw_id = str(homework.get('id', homework['homework_name']))
+    status = homework['status']
+    if statuses.get(hw_id) == status:
+        logger.debug('Статус работы не изменился')
+        return None
+    if pause:
+        time.sleep(SEND_INTERVAL)
+    if not send_message(bot, message):
+        return False
+    statuses[hw_id] = status
+    save_state(state)
+    return True
+
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    Вычисляет паузу перед повтором после ошибки.
+
+    Если сервер сообщил, сколько нужно подождать, ждём ровно столько,
+    иначе пауза растёт экспоненциально с номером попытки.
+    К паузе добавляется случайная составляющая, чтобы повторы
+    не выстраивались в одну линию.
+    :param attempt: Номер подряд идущей неудачной попытки, начиная с 0.
+    :type attempt: int
+    :param retry_after: Пауза в секундах, запрошенная сервером.
+    :type retry_after: int | None
+    :return: Пауза в секундах.
+    :rtype: float
+    """
+    jitter = random.uniform(0, BACKOFF_JITTER)
+    if retry_after is not None:
+        return retry_after + jitter
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + jitter
+
+
+def poll_once(bot, state, timestamp):
+    """
+    Выполняет один опрос API и отправляет изменившиеся статусы работ.
+
+    :param bot: Экземпляр объекта Bot из библиотеки python-telegram-bot.
+    :type bot: telegram.Bot
+    :param state: Словарь с состоянием бота.
+    :type state: dict
+    :param timestamp: Unix-время, начиная с которого запрашиваются данные.
+    :type timestamp: int
+    :return: Метка времени для следующего опроса и признак того, что статус
+    хотя бы одной работы изменился.
+    :rtype: tuple
+    """
+    response = get_api_answer(timestamp)
+    homework_list = check_response(response)
+    if not homework_list:
+        logger.debug('Список домашних работ пуст')
+    changed = False
+    undelivered = False
+    # API отдаёт работы от новых к старым, а сообщения отправляем
+    # в хронологическом порядке.
+    for homework in reversed(homework_list):
+        try:
+            delivered = notify_status(bot, homework, state, pause=changed)
+        except (KeyError, UndocumentedStatus):
+            # Одна некорректная работа не должна мешать отправить остальные
+            # и сдвинуть метку времени опроса; ошибку уже залогировал
+            # parse_status.
+            continue
+        if delivered is not None:
+            changed = True
+            undelivered = undelivered or not delivered
+    if undelivered:
+        # Метку времени не сдвигаем: иначе API больше не вернёт работу,
+        # статус которой не дошёл до чата. Уже отправленные статусы
+        # не повторятся благодаря кэшу.
+        logger.warning('Не все статусы доставлены, повторим при следующем '
+                       'опросе')
+        return timestamp, changed
+    timestamp = response.get('current_date', timestamp)
+    if state.get('timestamp') != timestamp:
+        state['timestamp'] = timestamp
+        save_state(state)
+    return timestamp, changed
+
+
+def error_key(error):
+    """
+    Возвращает устойчивый ключ ошибки для поиска повторов.
+
+    Текст сетевых ошибок может содержать адреса объектов, которые меняются
+    от попытки к попытке, поэтому для них учитывается только тип ошибки,
+    а для ошибок API — код ответа.
+    :param error: Исключение, возникшее при опросе.
+    :type error: Exception
+    :return: Ключ ошибки.
+    :rtype: tuple
+    """
+    if isinstance(error, APIStatusError):
+        return type(error).__name__, error.status_code
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return (type(error).__name__,)
+    return type(error).__name__, str(error)
+
+
+def report_error(bot, error, last_error):
+    """
+    Сообщает в чат о сбое в работе программы.
+
+    Одна и та же ошибка подряд доставляется в чат только один раз; ошибки
+    сравниваются по error_key, а в чат уходит полный текст. Ошибки
+    отправки лишь логируются, чтобы сбой Telegram не порождал новых
+    исключений в обработчике ошибок.
+    :param bot: Экземпляр объекта Bot из библиотеки python-telegram-bot.
+    :type bot: telegram.Bot
+    :param error: Исключение, возникшее при опросе.
+    :type error: Exception
+    :param last_error: Ключ последней доставленной в чат ошибки.
+    :type last_error: tuple | None
+    :return: Ключ последней доставленной в чат ошибки: ключ error, если
+    сообщение отправлено, иначе last_error.
+    :rtype: tuple | None
+    """
+    key = error_key(error)
+    if key == last_error:
+        return last_error
+    try:
+        if send_message(bot, f'Сбой в работе программы: {error}'):
+            return key
+    except RateLimitError as e:
+        logger.warning(f'Сообщение об ошибке не отправлено: {e}')
+    return last_error
+
+
+def handle_sigterm(signum, frame):
+    """Переводит сигнал SIGTERM в штатное завершение работы бота."""
+    raise SystemExit(0)
+
+
 def main():
     """Основная логика работы бота."""
     # Проверяем переменные окружения
-    check = check_tokens()
-    if not check:
-        error_message = 'Переменная окружения не задана'
-        logging.critical(error_message)
+    if not check_tokens():
         sys.exit(1)
-    logging.debug('Все переменные окружения доступны')
-    bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    period_time_seconds = PERIOD_TIME_DAYS * 24 * 60 * 60
-    timestamp = int(time.time() - period_time_seconds)
-    while True:
-        try:
-            response = get_api_answer(timestamp)
-            validated_response = check_response(response)
-            homework_list = validated_response['homeworks']
-            if not homework_list:
-                logging.warning('Список домашних работ пуст')
-                continue
-            homework = homework_list[-1]
-            message = parse_status(homework)
-            send_message(bot, message)
-            timestamp = response.get('current_date', timestamp)
-        except Exception as error:
-            logging.error(f'Произошла ошибка: {error}')
-            message = f'Сбой в работе программы: {error}'
+    # По умолчанию у бота пул из одного соединения, и несколько сообщений
+    # за опрос отправлялись бы по очереди через него.
+    request = Request(con_pool_size=8, connect_timeout=5.0, read_timeout=15.0)
+    bot = telegram.Bot(token=TELEGRAM_TOKEN, request=request)
+    # Платформа останавливает воркер сигналом SIGTERM: прерываем ожидание
+    # и закрываем соединения, не дожидаясь конца паузы.
+    previous_sigterm = signal.signal(signal.SIGTERM, handle_sigterm)
+    state = load_state()
+    timestamp = state.get('timestamp', int(time.time()) - PERIOD_SECONDS)
+    interval = RETRY_PERIOD
+    attempt = 0
+    last_error = None
+    # Опросы планируются по монотонным часам: переводы системного времени
+    # не сбивают интервал, а время самого опроса входит в паузу.
+    deadline = time.monotonic()
+    try:
+        while True:
+            try:
+                timestamp, changed = poll_once(bot, state, timestamp)
+                attempt = 0
+                last_error = None
+                # Пока статусы не меняются, каждый следующий опрос
+                # откладывается вдвое дольше; при изменении возвращаемся
+                # к RETRY_PERIOD.
+                if changed:
+                    interval = RETRY_PERIOD
+                delay = interval
+                if not changed:
+                    interval = min(interval * 2, MAX_INTERVAL)
+                # Если опрос затянулся дольше паузы, следующий начинается
+                # сразу, без попыток нагнать пропущенные.
+                deadline = max(deadline + delay, time.monotonic())
+            except RateLimitError as error:
+                logger.warning(error)
+                # Паузу после ошибки отсчитываем от момента ошибки, чтобы
+                # длительность опроса не сокращала её.
+                deadline = time.monotonic() + backoff_delay(
+                    attempt, error.retry_after
+                )
+                attempt += 1
+            except Exception as error:
+                logger.error(f'Произошла ошибка: {error}')
+                last_error = report_error(bot, error, last_error)
+                deadline = time.monotonic() + backoff_delay(attempt)
+                attempt += 1
             # Устанавливаем задержку выполнения кода на определенный период.
-        finally:
-            time.sleep(RETRY_PERIOD)
+            sleep_for = max(0, deadline - time.monotonic())
+            time.sleep(sleep_for)
+    except (KeyboardInterrupt, SystemExit):
+        logger.info('Бот остановлен')
+    finally:
+        SESSION.close()
+        request.stop()
+        signal.signal(signal.SIGTERM, previous_sigterm or signal.SIG_DFL)
 
 
 if __name__ == '__main__':
+    logging.config.dictConfig(LOGGING_CONFIG)
     main()
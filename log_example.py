@@ -1,21 +1,18 @@
 import logging
 import sys
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s, %(levelname)s, %(message)s, %(name)s'
-)
-
 logger = logging.getLogger(__name__)
-# Устанавливаем уровень, с которого логи будут сохраняться в файл
-logger.setLevel(logging.INFO)
-# Указываем обработчик логов
-handler = logging.StreamHandler(stream=sys.stdout)
-logger.addHandler(handler)
 
-# Создаем форматер
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-# Применяем его к хэндлеру
-handler.setFormatter(formatter)
+if __name__ == '__main__':
+    # Устанавливаем уровень, с которого логи будут сохраняться в файл
+    logger.setLevel(logging.INFO)
+    # Указываем обработчик логов
+    handler = logging.StreamHandler(stream=sys.stdout)
+    logger.addHandler(handler)
+
+    # Создаем форматер
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # Применяем его к хэндлеру
+    handler.setFormatter(formatter)
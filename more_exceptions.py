@@ -16,3 +16,44 @@ class UndocumentedStatus(Exception):
     """
 
     pass
+
+
+class RateLimitError(Exception):
+    """
+    Исключение, возбуждаемое при превышении лимита запросов к API.
+
+    Атрибуты:
+        retry_after (int): Сколько секунд нужно подождать перед повторным
+        запросом.
+
+    Пример использования:
+        try:
+            # Запрос к API, который может вернуть код 429
+        except RateLimitError as error:
+            time.sleep(error.retry_after)
+    """
+
+    def __init__(self, retry_after, message='Превышен лимит запросов'):
+        """Сохраняет паузу, которую запросил сервер."""
+        super().__init__(f'{message}, повтор через {retry_after} с')
+        self.retry_after = retry_after
+
+
+class APIStatusError(Exception):
+    """
+    Исключение, возбуждаемое, когда API вернул неожиданный код ответа.
+
+    Атрибуты:
+        status_code (int): Код ответа API.
+
+    Пример использования:
+        try:
+            # Запрос к API
+        except APIStatusError as error:
+            print(error.status_code)
+    """
+
+    def __init__(self, status_code):
+        """Сохраняет код ответа API."""
+        super().__init__(f'Ошибка при запросе API: код ответа {status_code}')
+        self.status_code = status_code
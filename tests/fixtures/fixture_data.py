@@ -17,6 +17,14 @@ def current_timestamp():
     return int(datetime.now().timestamp())
 
 
+@pytest.fixture(autouse=True)
+def state_file(tmp_path, monkeypatch):
+    import homework
+    path = tmp_path / 'hw_state.json'
+    monkeypatch.setattr(homework, 'STATE_FILE', str(path))
+    return path
+
+
 @pytest.fixture
 def homework_module():
     import homework
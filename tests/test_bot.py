@@ -1,6 +1,7 @@
 import inspect
 import logging
 import re
+import signal
 import time
 from http import HTTPStatus
 
@@ -165,16 +166,17 @@ class TestHomework:
             assert url.startswith(expected_url), (
                 'Проверьте адрес, на который отправляются запросы.'
             )
-            assert 'headers' in kwargs, (
-                'Проверьте, что в запрос к API передан заголовок.'
-            )
-            assert 'Authorization' in kwargs['headers'], (
-                'Проверьте, что в заголовках запроса передано поле '
+            headers = homework_module.SESSION.headers
+            assert 'Authorization' in headers, (
+                'Проверьте, что в заголовках сессии передано поле '
                 '`Authorization`.'
             )
-            assert kwargs['headers']['Authorization'].startswith('OAuth '), (
+            assert headers['Authorization'].startswith('OAuth '), (
                 'Проверьте, что заголовок `Authorization` начинается с `OAuth`.'
             )
+            assert kwargs.get('timeout'), (
+                'Проверьте, что у запроса к API задан таймаут.'
+            )
             assert 'params' in kwargs, (
                 'Проверьте, что в запросе переданы параметры `params`.'
             )
@@ -192,7 +194,7 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_get_call)
+        monkeypatch.setattr(homework_module.SESSION, 'get', check_request_get_call)
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError as e:
@@ -215,7 +217,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
@@ -235,7 +237,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(homework_module.SESSION, 'get', response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -246,6 +248,43 @@ class TestHomework:
                 'ситуация, когда API домашки возвращает код, отличный от 200.'
             )
 
+    def test_get_api_answer_rate_limited(self, monkeypatch, current_timestamp,
+                                         homework_module):
+        def mock_response_get(*args, **kwargs):
+            response = utils.MockResponseGET(
+                *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+            )
+            response.headers = {'Retry-After': '42'}
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        with pytest.raises(homework_module.RateLimitError) as exc_info:
+            homework_module.get_api_answer(current_timestamp)
+        assert exc_info.value.retry_after == 42, (
+            'Убедитесь, что пауза берётся из заголовка `Retry-After`.'
+        )
+
+    def test_backoff_delay(self, homework_module):
+        jitter = homework_module.BACKOFF_JITTER
+        base = homework_module.BACKOFF_BASE
+        assert base <= homework_module.backoff_delay(0) <= base + jitter
+        assert homework_module.backoff_delay(100) <= (
+            homework_module.BACKOFF_CAP + jitter
+        )
+        assert 42 <= homework_module.backoff_delay(5, retry_after=42) <= (
+            42 + jitter
+        )
+
+    def test_get_api_answer_with_timeout(self, current_timestamp,
+                                         monkeypatch, homework_module):
+        def mock_request_get_with_timeout(*args, **kwargs):
+            raise requests.Timeout('Read timed out')
+
+        monkeypatch.setattr(homework_module.SESSION, 'get',
+                            mock_request_get_with_timeout)
+        with pytest.raises(TimeoutError):
+            homework_module.get_api_answer(current_timestamp)
+
     def test_get_api_answer_with_request_exception(self, current_timestamp,
                                                    monkeypatch,
                                                    homework_module):
@@ -259,7 +298,7 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_request_get_with_exception)
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException:
@@ -509,6 +548,21 @@ class TestHomework:
             except Exception:
                 pass
 
+    def test_send_message_with_tg_retry_after(self, monkeypatch,
+                                              random_message,
+                                              homework_module):
+        bot = get_mock_telegram_bot(monkeypatch, random_message)
+
+        def send_message_with_retry_after(chat_id=None, text=None, **kwargs):
+            raise telegram.error.RetryAfter(7)
+
+        monkeypatch.setattr(bot, 'send_message', send_message_with_retry_after)
+        with pytest.raises(homework_module.RateLimitError) as exc_info:
+            homework_module.send_message(bot, 'Test_message_check')
+        assert exc_info.value.retry_after == 7, (
+            'Убедитесь, что пауза берётся из `telegram.error.RetryAfter`.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -519,7 +573,7 @@ class TestHomework:
 
         main_source = inspect.getsource(homework_module.main)
         bot_init_pattern = re.compile(
-            r'(\# *)?(\w* ?= ?)(telegram\.Bot\( *[\w=_\-\'\"]* *\))'
+            r'(\# *)?(\w* ?= ?)(telegram\.Bot\( *[\w=_\-\'\", ]* *\))'
         )
         search_result = re.search(bot_init_pattern, main_source)
         is_commented = search_result[1] is None if search_result else False
@@ -528,7 +582,7 @@ class TestHomework:
         )
 
         bot_init_with_token_pattern = re.compile(
-            r'telegram\.Bot\( *token *= *TELEGRAM_TOKEN *\)'
+            r'telegram\.Bot\( *token *= *TELEGRAM_TOKEN *[,)]'
         )
         assert re.search(bot_init_with_token_pattern, main_source), (
             'Убедитесь, что при создании бота в него передан токен: '
@@ -559,9 +613,9 @@ class TestHomework:
         )
 
         def sleep_to_interrupt(secs):
-            assert secs == self.RETRY_PERIOD, (
+            assert 0 <= secs <= self.RETRY_PERIOD, (
                 'Убедитесь, что повторный запрос к API домашки отправляется '
-                'через 10 минут: `time.sleep(RETRY_PERIOD)`.'
+                'не позже чем через 10 минут.'
             )
             raise utils.BreakInfiniteLoop('break')
 
@@ -587,7 +641,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
 
     def test_main_without_env_vars_raise_exception(
             self, caplog, monkeypatch, random_timestamp, current_timestamp,
@@ -641,7 +695,7 @@ class TestHomework:
                     if record.message == utils.MockResponseGET.CALLED_LOG_MSG
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует метод `SESSION.get()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -724,7 +778,7 @@ class TestHomework:
                 data=data_with_new_hw_status
             ))
         monkeypatch.setattr(
-            requests,
+            homework_module.SESSION,
             'get',
             mock_response_get_with_new_status
         )
@@ -753,6 +807,559 @@ class TestHomework:
                     'из переменной `HOMEWORK_VERDICTS`.'
                 )
 
+    def test_main_skips_already_sent_status(self, monkeypatch,
+                                            random_timestamp,
+                                            current_timestamp,
+                                            random_message,
+                                            caplog, homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        data = {
+            'homeworks': [
+                {
+                    'id': 123,
+                    'homework_name': 'hw123',
+                    'status': 'approved'
+                }
+            ],
+            'current_date': random_timestamp
+        }
+        monkeypatch.setattr(
+            homework_module.SESSION,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data
+            )
+        )
+        homework_module.save_state({'statuses': {'123': 'approved'}})
+
+        def mock_send_message(bot, message=''):
+            logging.warn(message)
+            return True
+
+        monkeypatch.setattr(
+            homework_module,
+            'send_message',
+            mock_send_message
+        )
+        with caplog.at_level(logging.WARN):
+            with pytest.raises(utils.BreakInfiniteLoop):
+                homework_module.main()
+        assert not [
+            record for record in caplog.records
+            if self.HOMEWORK_VERDICTS['approved'] in record.message
+        ], (
+            'Убедитесь, что бот не отправляет повторно уже известный статус '
+            'домашней работы.'
+        )
+
+    def test_main_sends_all_changed_statuses(self, monkeypatch,
+                                             random_timestamp,
+                                             current_timestamp,
+                                             random_message,
+                                             homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        data = {
+            'homeworks': [
+                {'id': 2, 'homework_name': 'hw2', 'status': 'reviewing'},
+                {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            ],
+            'current_date': random_timestamp
+        }
+        monkeypatch.setattr(
+            homework_module.SESSION,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data
+            )
+        )
+        sent = []
+
+        def mock_send_message(bot, message=''):
+            sent.append(message)
+            return True
+
+        clock = utils.FakeClock()
+
+        def sleep_to_interrupt(secs):
+            clock.sleep(secs)
+            if secs >= homework_module.RETRY_PERIOD:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert len(sent) == 2, (
+            'Убедитесь, что бот отправляет все изменившиеся за опрос статусы.'
+        )
+        assert '"hw1"' in sent[0] and '"hw2"' in sent[1], (
+            'Убедитесь, что статусы отправляются в хронологическом порядке.'
+        )
+
+    def test_main_skips_invalid_homework(self, monkeypatch,
+                                         random_timestamp,
+                                         current_timestamp,
+                                         random_message,
+                                         homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        data = {
+            'homeworks': [
+                {'id': 3, 'homework_name': 'hw3', 'status': 'approved'},
+                {'id': 2, 'homework_name': 'hw2', 'status': 'weird'},
+                {'id': 1, 'status': 'rejected'},
+            ],
+            'current_date': random_timestamp
+        }
+        monkeypatch.setattr(
+            homework_module.SESSION,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data
+            )
+        )
+        sent = []
+
+        def mock_send_message(bot, message=''):
+            sent.append(message)
+            return True
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert len(sent) == 1 and '"hw3"' in sent[0], (
+            'Убедитесь, что работа с некорректными данными не мешает '
+            'отправить статусы остальных работ.'
+        )
+        assert homework_module.load_state()['timestamp'] == random_timestamp, (
+            'Убедитесь, что метка времени опроса сдвигается, даже если '
+            'в ответе есть работа с некорректными данными.'
+        )
+
+    def test_main_refetches_after_failed_send(self, monkeypatch,
+                                              random_timestamp,
+                                              current_timestamp,
+                                              random_message,
+                                              homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        saved_timestamp = 1000000000
+        homework_module.save_state({'timestamp': saved_timestamp})
+        data = {
+            'homeworks': [
+                {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            ],
+            'current_date': random_timestamp
+        }
+        from_dates = []
+
+        def mock_response_get(*args, **kwargs):
+            from_dates.append(kwargs['params']['from_date'])
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.json = lambda: data
+            return response
+
+        clock = utils.FakeClock()
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            if len(from_dates) == 2:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module, 'send_message',
+                            lambda bot, message='': False)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert from_dates == [saved_timestamp, saved_timestamp], (
+            'Убедитесь, что после неудачной отправки статуса следующий опрос '
+            'запрашивает данные с прежней метки времени.'
+        )
+        assert homework_module.load_state()['timestamp'] == saved_timestamp, (
+            'Убедитесь, что после неудачной отправки статуса метка времени '
+            'не сохраняется.'
+        )
+
+    @pytest.mark.parametrize('content', ['[1, 2]', '42', '{"timestamp": 1'])
+    def test_load_state_ignores_invalid_file(self, content, state_file,
+                                             homework_module):
+        state_file.write_text(content, encoding='utf-8')
+        assert homework_module.load_state() == {}, (
+            'Убедитесь, что повреждённый файл состояния не мешает запуску '
+            'бота.'
+        )
+
+    def test_poll_once_pauses_only_between_sends(self, monkeypatch,
+                                                 random_timestamp,
+                                                 homework_module):
+        data = {
+            'homeworks': [
+                {'id': 4, 'homework_name': 'hw4', 'status': 'approved'},
+                {'id': 3, 'homework_name': 'hw3', 'status': 'weird'},
+                {'id': 2, 'homework_name': 'hw2', 'status': 'reviewing'},
+                {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            ],
+            'current_date': random_timestamp
+        }
+        monkeypatch.setattr(
+            homework_module.SESSION,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data
+            )
+        )
+        events = []
+
+        def mock_send_message(bot, message=''):
+            events.append('send')
+            return True
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'sleep', lambda secs: events.append('sleep'))
+        state = {'statuses': {'2': 'reviewing'}}
+        homework_module.poll_once(None, state, 0)
+        assert events == ['send', 'sleep', 'send'], (
+            'Убедитесь, что пауза между сообщениями выдерживается только '
+            'перед реальной отправкой.'
+        )
+
+    def test_main_polls_from_saved_timestamp(self, monkeypatch,
+                                             random_timestamp,
+                                             current_timestamp,
+                                             random_message,
+                                             homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        saved_timestamp = 1000000000
+        homework_module.save_state({'timestamp': saved_timestamp})
+        from_dates = []
+
+        def mock_response_get(*args, **kwargs):
+            from_dates.append(kwargs['params']['from_date'])
+            return utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert from_dates == [saved_timestamp], (
+            'Убедитесь, что после перезапуска бот продолжает опрос API '
+            'с сохранённой метки времени.'
+        )
+        assert homework_module.load_state()['timestamp'] == random_timestamp, (
+            'Убедитесь, что бот сохраняет `current_date` из ответа API.'
+        )
+
+    def test_main_slows_down_while_idle(self, monkeypatch,
+                                        random_timestamp,
+                                        current_timestamp,
+                                        random_message,
+                                        homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        delays = []
+
+        clock = utils.FakeClock()
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            delays.append(secs)
+            if len(delays) == 4:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert delays == [600, 1200, 2400, 3600], (
+            'Убедитесь, что при отсутствии изменений интервал опроса '
+            'удваивается, но не превышает `MAX_INTERVAL`.'
+        )
+
+    def test_main_reports_repeated_error_once(self, monkeypatch,
+                                              random_timestamp,
+                                              current_timestamp,
+                                              random_message,
+                                              homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', self.NOT_OK_RESPONSES[500]
+        )
+        sent = []
+        delays = []
+
+        def mock_send_message(bot, message=''):
+            sent.append(message)
+            return True
+
+        clock = utils.FakeClock()
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            delays.append(secs)
+            if len(delays) == 3:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert len(sent) == 1, (
+            'Убедитесь, что одна и та же ошибка отправляется в Telegram '
+            'только один раз.'
+        )
+        assert sent[0].startswith('Сбой в работе программы'), (
+            'Убедитесь, что бот сообщает в Telegram о сбое в работе программы.'
+        )
+
+    def test_main_keeps_cadence_on_monotonic_clock(self, monkeypatch,
+                                                   random_timestamp,
+                                                   current_timestamp,
+                                                   random_message,
+                                                   homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        clock = utils.FakeClock()
+        delays = []
+
+        def slow_response_get(*args, **kwargs):
+            clock.sleep(100)
+            return utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            delays.append(secs)
+            if len(delays) == 2:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', slow_response_get)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert delays == [500, 1100], (
+            'Убедитесь, что время самого запроса к API учитывается '
+            'в паузе между опросами.'
+        )
+
+    def test_main_waits_retry_after_on_rate_limit(self, monkeypatch,
+                                                  random_timestamp,
+                                                  current_timestamp,
+                                                  random_message,
+                                                  homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        clock = utils.FakeClock()
+        delays = []
+
+        def mock_response_get(*args, **kwargs):
+            response = utils.MockResponseGET(
+                *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+            )
+            response.headers = {'Retry-After': '60'}
+            return response
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            delays.append(secs)
+            raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert 60 <= delays[0] <= 60 + homework_module.BACKOFF_JITTER, (
+            'Убедитесь, что при ответе 429 бот ждёт паузу из `Retry-After`.'
+        )
+
+    def test_main_stops_cleanly_on_sigterm(self, monkeypatch,
+                                           random_timestamp,
+                                           current_timestamp,
+                                           random_message,
+                                           homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        closed = []
+
+        class MockRequest:
+            def __init__(self, **kwargs):
+                pass
+
+            def stop(self):
+                closed.append('request')
+
+        def sigterm_during_sleep(secs):
+            homework_module.handle_sigterm(signal.SIGTERM, None)
+
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        monkeypatch.setattr(homework_module, 'Request', MockRequest)
+        monkeypatch.setattr(homework_module.SESSION, 'close',
+                            lambda: closed.append('session'))
+        monkeypatch.setattr(time, 'sleep', sigterm_during_sleep)
+        homework_module.main()
+        assert sorted(closed) == ['request', 'session'], (
+            'Убедитесь, что при остановке бота закрываются сессия API '
+            'и пул соединений Telegram.'
+        )
+        assert signal.getsignal(signal.SIGTERM) == previous_handler, (
+            'Убедитесь, что после остановки бота восстанавливается прежний '
+            'обработчик SIGTERM.'
+        )
+
+    def test_report_error_ignores_unstable_error_text(self, monkeypatch,
+                                                      homework_module):
+        sent = []
+
+        def mock_send_message(bot, message=''):
+            sent.append(message)
+            return True
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        last_error = None
+        for address in ('0x7f01', '0x7f02'):
+            error = ConnectionError(
+                'Ошибка при запросе API: <urllib3.connection.HTTPSConnection '
+                f'object at {address}>'
+            )
+            last_error = homework_module.report_error(None, error, last_error)
+        assert len(sent) == 1 and '0x7f01' in sent[0], (
+            'Убедитесь, что повторяющаяся сетевая ошибка отправляется один '
+            'раз, а в чат уходит её полный текст.'
+        )
+
+    def test_report_error_retries_undelivered_error(self, monkeypatch,
+                                                    homework_module):
+        results = iter([False, True])
+        sent = []
+
+        def mock_send_message(bot, message=''):
+            sent.append(message)
+            return next(results)
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        error = ValueError('boom')
+        message = 'Сбой в работе программы: boom'
+        last_error = homework_module.report_error(None, error, None)
+        assert last_error is None, (
+            'Убедитесь, что недоставленная ошибка не считается отправленной.'
+        )
+        last_error = homework_module.report_error(None, error, last_error)
+        assert last_error is not None
+        homework_module.report_error(None, error, last_error)
+        assert sent == [message, message], (
+            'Убедитесь, что ошибка повторно отправляется, пока не будет '
+            'доставлена, и не дублируется после доставки.'
+        )
+
+    def test_main_waits_full_retry_after_after_slow_response(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        clock = utils.FakeClock()
+        delays = []
+
+        def slow_rate_limited_get(*args, **kwargs):
+            clock.sleep(20)
+            response = utils.MockResponseGET(
+                *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+            )
+            response.headers = {'Retry-After': '60'}
+            return response
+
+        def collect_sleep(secs):
+            clock.sleep(secs)
+            delays.append(secs)
+            raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module.SESSION, 'get',
+                            slow_rate_limited_get)
+        monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+        monkeypatch.setattr(time, 'sleep', collect_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert delays[0] >= 60, (
+            'Убедитесь, что пауза из `Retry-After` отсчитывается от момента '
+            'получения ответа, а не сокращается на время запроса.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             utils.check_docstring(homework_module, func)
@@ -1,3 +1,4 @@
+import json
 import logging
 from collections import namedtuple
 from contextlib import contextmanager
@@ -83,6 +84,10 @@ class MockResponseGET:
         self.text = ''
         logging.warn(MockResponseGET.CALLED_LOG_MSG)
 
+    @property
+    def content(self):
+        return json.dumps(self.json()).encode()
+
     def json(self):
         data = {
             "homeworks": [],
@@ -101,5 +106,18 @@ class MockTelegramBot:
         self.text = text
 
 
+class FakeClock:
+    """Monotonic clock that advances only when `sleep` is called."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, secs):
+        self.now += secs
+
+
 class BreakInfiniteLoop(Exception):
     pass